@@ -2,12 +2,15 @@
 __docformat__ = "numpy"
 
 import argparse
+import functools
 import logging
-from datetime import datetime
-from typing import Dict, List
+import time
+from datetime import date, datetime
+from typing import Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
-from prompt_toolkit.completion import NestedCompleter
+from prompt_toolkit.completion import NestedCompleter, WordCompleter
 
 from openbb_terminal import feature_flags as obbff
 from openbb_terminal.decorators import log_start_end
@@ -19,8 +22,7 @@ from openbb_terminal.helper_funcs import (
 from openbb_terminal.menu import session
 from openbb_terminal.parent_classes import BaseController
 from openbb_terminal.rich_config import console
-from openbb_terminal.stocks.options.hedge import hedge_view
-from openbb_terminal.stocks.options.hedge.hedge_model import add_hedge_option
+from openbb_terminal.stocks.options.hedge import hedge_model, hedge_view
 from openbb_terminal.stocks.options.yfinance_model import (
     get_option_chain,
     get_price,
@@ -32,6 +34,112 @@ from openbb_terminal.stocks.options.yfinance_view import plot_payoff
 
 logger = logging.getLogger(__name__)
 
+SIGN_TO_SIDE = {1: "Long", -1: "Short"}
+
+CALL_PICK_SUFFIXES = (" Long Call", " Short Call")
+PUT_PICK_SUFFIXES = (" Long Put", " Short Put")
+
+EMPTY_GREEKS = (0, 0, 0, False)
+
+GREEKS_INDEX = {
+    "Portfolio": hedge_model.PORTFOLIO,
+    "Option A": hedge_model.OPTION_A,
+    "Option B": hedge_model.OPTION_B,
+}
+
+
+def _ttl_cache(maxsize: int = 128, ttl: float = 300):
+    """Cache the results of a function for ttl seconds, keeping maxsize entries"""
+
+    def decorator(func):
+        cache: Dict = {}
+
+        @functools.wraps(func)
+        def wrapper(*args):
+            now = time.monotonic()
+            # Entries are kept in insertion order, so the expired ones are at the front
+            while cache:
+                oldest = next(iter(cache))
+                if now - cache[oldest][0] < ttl:
+                    break
+                del cache[oldest]
+
+            if args in cache:
+                return cache[args][1]
+
+            result = func(*args)
+            if len(cache) >= maxsize:
+                # Dictionaries keep insertion order, so the first key is the oldest
+                cache.pop(next(iter(cache)))
+            cache[args] = (now, result)
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def _find_strike(strikes: np.ndarray, strike: float) -> int:
+    """Row of the strike in a sorted float32 strike array, -1 when it is not listed"""
+    target = np.float32(strike)
+    index = int(np.searchsorted(strikes, target))
+    if index < len(strikes) and strikes[index] == target:
+        return index
+    return -1
+
+
+@_ttl_cache(maxsize=8, ttl=300)
+def _cached_chain(ticker: str, expiration: str):
+    """Option chain for the ticker and expiration, reused for five minutes"""
+    return get_option_chain(ticker, expiration)
+
+
+@_ttl_cache(maxsize=128, ttl=300)
+def _cached_price(ticker: str) -> float:
+    """Current price of the ticker, reused for five minutes"""
+    return get_price(ticker)
+
+
+def _format_strike(strike: float) -> str:
+    """Strike as typed by the user, e.g. 100 or 67.5 instead of 100.0 or 67.50"""
+    return f"{strike:.2f}".rstrip("0").rstrip(".")
+
+
+@functools.lru_cache(maxsize=32)
+def _build_menu_choices(
+    call_strikes: Tuple[float, ...], put_strikes: Tuple[float, ...], n_options: int
+) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """Build the pick and add choices of the hedge menu
+
+    Parameters
+    ----------
+    call_strikes: Tuple[float, ...]
+        Listed call strikes of the option chain
+    put_strikes: Tuple[float, ...]
+        Listed put strikes of the option chain
+    n_options: int
+        Number of identifiers available to the add command
+
+    Returns
+    -------
+    pick_choices: Tuple[str, ...]
+        Strike, position and side combinations to pick
+    add_choices: Tuple[str, ...]
+        Option identifiers to add
+    """
+    pick_choices = tuple(
+        _format_strike(strike) + suffix
+        for strikes, suffixes in [
+            (call_strikes, CALL_PICK_SUFFIXES),
+            (put_strikes, PUT_PICK_SUFFIXES),
+        ]
+        for strike in strikes
+        for suffix in suffixes
+    )
+    add_choices = tuple(str(c) for c in range(n_options))
+
+    return pick_choices, add_choices
+
 
 class HedgeController(BaseController):
     """Hedge Controller class"""
@@ -52,72 +160,150 @@ class HedgeController(BaseController):
         super().__init__(queue)
 
         self.underlying_asset_position: str = ""
-        self.chain = get_option_chain(ticker, expiration)
-        self.calls = list(
-            zip(
-                self.chain.calls["strike"].tolist(),
-                self.chain.calls["impliedVolatility"].tolist(),
-                self.chain.calls["lastPrice"].tolist(),
-            )
-        )
-        self.puts = list(
-            zip(
-                self.chain.puts["strike"].tolist(),
-                self.chain.puts["impliedVolatility"].tolist(),
-                self.chain.puts["lastPrice"].tolist(),
-            )
+        chain = _cached_chain(ticker, expiration)
+        # Columns are strike, implied volatility and last price
+        self._calls_arr = chain.calls[
+            ["strike", "impliedVolatility", "lastPrice"]
+        ].to_numpy(dtype=np.float64)
+        self._puts_arr = chain.puts[
+            ["strike", "impliedVolatility", "lastPrice"]
+        ].to_numpy(dtype=np.float64)
+        # Strikes are listed in ascending order and only need float32 precision to be
+        # matched with a binary search
+        self._call_strikes = self._calls_arr[:, 0].astype(np.float32)
+        self._put_strikes = self._puts_arr[:, 0].astype(np.float32)
+        # Views on the implied volatility column, no copy is made
+        self._call_iv_arr = self._calls_arr[:, 1]
+        self._put_iv_arr = self._puts_arr[:, 1]
+
+        self.PICK_CHOICES, add_choices = _build_menu_choices(
+            tuple(self._calls_arr[:, 0].tolist()),
+            tuple(self._puts_arr[:, 0].tolist()),
+            max(len(self._puts_arr), len(self._calls_arr)),
         )
 
-        self.PICK_CHOICES = [
-            f"{strike} {position} {side}"
-            for strike in range(int(self.calls[0][0]), int(self.calls[-1][0]), 5)
-            for position in ["Long", "Short"]
-            for side in ["Call", "Put"]
-        ]
-
         self.ticker = ticker
-        self.current_price: float = get_price(ticker)
+        self.current_price: float = _cached_price(ticker)
         self.expiration = expiration
-        self.implied_volatility = self.chain.calls["impliedVolatility"]
+        self._expiry_dt = datetime.strptime(expiration, "%Y-%m-%d")
+        self._t_years_value = 0.0
+        self._t_years_date: Optional[date] = None
         self.options: Dict = {"Portfolio": {}, "Option A": {}, "Option B": {}}
         self.underlying = 0.0
         self.side: str = ""
         self.amount = 0.0
         self.strike = 0.0
-        self.call_index_choices = range(len(self.calls))
-        self.put_index_choices = range(len(self.puts))
-        self.greeks: Dict = {"Portfolio": {}, "Option A": {}, "Option B": {}}
+        self.call_index_choices = range(len(self._calls_arr))
+        self.put_index_choices = range(len(self._puts_arr))
+        self._g = np.zeros(3, dtype=hedge_model.GREEKS_DTYPE)
+        self.portfolio_option: Dict = {}
+        self._positions_cache: Optional[pd.DataFrame] = None
+        self._positions_pending = False
 
         if session and obbff.USE_PROMPT_TOOLKIT:
             choices: dict = {c: None for c in self.controller_choices}
-            choices["pick"] = {c: None for c in self.PICK_CHOICES}
-            choices["add"] = {
-                str(c): {} for c in list(range(max(len(self.puts), len(self.calls))))
-            }
-            # This menu contains dynamic choices that may change during runtime
-            self.choices = choices
+            # This menu contains dynamic choices that may change during runtime,
+            # those are updated in place on the completer
             self.completer = NestedCompleter.from_nested_dict(choices)
+            self.completer.options["pick"] = WordCompleter(
+                list(self.PICK_CHOICES), ignore_case=True, sentence=True
+            )
+            self.completer.options["add"] = WordCompleter(
+                list(add_choices), ignore_case=True, sentence=True
+            )
+
+    def update_greeks(self, time_to_expiration: float):
+        """Recalculate the greeks of the portfolio and selected options in one batch"""
+        names = [name for name in ["Option A", "Option B"] if self.options[name]]
+        indices = [hedge_model.PORTFOLIO] + [GREEKS_INDEX[name] for name in names]
+        positions = [self.portfolio_option] + [self.options[name] for name in names]
+
+        greeks = hedge_model.greeks_batch(
+            np.full(len(positions), self.current_price, dtype=np.float64),
+            np.array([p["implied_volatility"] for p in positions], dtype=np.float64),
+            np.array([p["strike"] for p in positions], dtype=np.float64),
+            np.full(len(positions), time_to_expiration, dtype=np.float64),
+            np.array([1 if p["type"] == "Call" else -1 for p in positions]),
+        )
+
+        self._g["delta"][indices] = greeks[:, 0]
+        self._g["gamma"][indices] = greeks[:, 1]
+        self._g["vega"][indices] = greeks[:, 2]
+        self._g["set"][indices] = True
+
+    @property
+    def _t_years(self) -> float:
+        """Time to expiration in years, recomputed when the date changes"""
+        now = datetime.now()
+        if now.date() != self._t_years_date:
+            days = float((self._expiry_dt - now).days + 1)
+
+            if days == 0.0:
+                days = 0.01
+
+            self._t_years_value = days / 365
+            self._t_years_date = now.date()
+
+        return self._t_years_value
+
+    def _selected_options(self) -> List[Dict]:
+        """Options that have been added, skipping empty slots"""
+        return [
+            option
+            for option in [self.options["Option A"], self.options["Option B"]]
+            if option
+        ]
+
+    def _render_positions(self):
+        """Show the current option positions, building the table only after a change"""
+        if self._positions_cache is None:
+            # If a position is empty, skips the printing.
+            self._positions_cache = pd.DataFrame(
+                [
+                    [
+                        value["type"],
+                        SIGN_TO_SIDE[value["sign"]],
+                        value["strike"],
+                        value["implied_volatility"],
+                    ]
+                    for value in self.options.values()
+                    if value
+                ],
+                columns=["Type", "Hold", "Strike", "Implied Volatility"],
+            )
+
+        print_rich_table(
+            self._positions_cache,
+            title="Current Option Positions",
+            headers=list(self._positions_cache.columns),
+            show_index=False,
+        )
+
+    def _show_pending_positions(self):
+        """Show positions changed by add unless another add is queued next"""
+        if self._positions_pending and (
+            not self.queue or self.queue[0].split(" ")[0] != "add"
+        ):
+            self._render_positions()
+            self._positions_pending = False
 
     def update_runtime_choices(self):
         """Update runtime choices"""
         if self.options and session and obbff.USE_PROMPT_TOOLKIT:
-            self.choices["rmv"] = {c: None for c in ["Option A", "Option B"]}
-            self.completer = NestedCompleter.from_nested_dict(self.choices)
+            self.completer.options["rmv"] = NestedCompleter.from_nested_dict(
+                {c: None for c in ["Option A", "Option B"]}
+            )
 
     def print_help(self):
         """Print help"""
-        has_portfolio_start = "" if "Delta" in self.greeks["Portfolio"] else "[unvl]"
-        has_portfolio_end = "" if "Delta" in self.greeks["Portfolio"] else "[/unvl]"
-        has_option_start = (
-            ""
-            if "Delta" in self.greeks["Option A"] or "Delta" in self.greeks["Option B"]
-            else "[unvl]"
-        )
-        has_option_end = (
-            ""
-            if "Delta" in self.greeks["Option A"] or "Delta" in self.greeks["Option B"]
-            else "[/unvl]"
+        has_portfolio = self._g["set"][hedge_model.PORTFOLIO]
+        has_option = (
+            self._g["set"][hedge_model.OPTION_A] or self._g["set"][hedge_model.OPTION_B]
         )
+        has_portfolio_start = "" if has_portfolio else "[unvl]"
+        has_portfolio_end = "" if has_portfolio else "[/unvl]"
+        has_option_start = "" if has_option else "[unvl]"
+        has_option_end = "" if has_option else "[/unvl]"
         help_text = f"""
 [param]Ticker: [/param]{self.ticker or None}
 [param]Expiry: [/param]{self.expiration or None}
@@ -159,10 +345,12 @@ Underlying Asset Position: [/param]{self.underlying_asset_position}
         ns_parser = parse_known_args_and_warn(parser, other_args)
 
         if ns_parser:
-            calls = pd.DataFrame([call[0] for call in self.calls])
-            puts = pd.DataFrame([put[0] for put in self.puts])
-
-            options = pd.concat([calls, puts], axis=1).fillna("-")
+            options = pd.DataFrame(
+                {
+                    "Calls": pd.Series(self._calls_arr[:, 0]),
+                    "Puts": pd.Series(self._puts_arr[:, 0]),
+                }
+            ).fillna("-")
 
             print_rich_table(
                 options,
@@ -214,19 +402,19 @@ Underlying Asset Position: [/param]{self.underlying_asset_position}
         ns_parser = parse_known_args_and_warn(parser, other_args)
 
         if ns_parser:
-            if not self.greeks["Portfolio"]:
+            if not self._g["set"][hedge_model.PORTFOLIO]:
                 console.print(
                     "Please set the Underlying Asset Position by using the 'pick' command.\n"
                 )
             else:
                 opt_type = "Put" if ns_parser.put else "Call"
                 sign = -1 if ns_parser.short else 1
-                options_list = self.puts if ns_parser.put else self.calls
+                options_arr = self._puts_arr if ns_parser.put else self._calls_arr
 
-                if ns_parser.identifier < len(options_list):
-                    strike = options_list[ns_parser.identifier][0]
-                    implied_volatility = options_list[ns_parser.identifier][1]
-                    cost = options_list[ns_parser.identifier][2]
+                if ns_parser.identifier < len(options_arr):
+                    strike, implied_volatility, cost = options_arr[
+                        ns_parser.identifier
+                    ]
 
                     option = {
                         "type": opt_type,
@@ -236,87 +424,39 @@ Underlying Asset Position: [/param]{self.underlying_asset_position}
                         "cost": cost,
                     }
 
-                    print(cost)
-
-                    if opt_type == "Call":
-                        side = 1
-                    else:
-                        # Implies the option type is a put
-                        side = -1
-
-                    date_obj = datetime.strptime(self.expiration, "%Y-%m-%d")
-                    days = float((date_obj - datetime.now()).days + 1)
-
-                    if days == 0.0:
-                        days = 0.01
-
-                    if "Delta" not in self.greeks["Option A"]:
-                        self.options["Option A"] = option
-                        (
-                            self.greeks["Option A"]["Delta"],
-                            self.greeks["Option A"]["Gamma"],
-                            self.greeks["Option A"]["Vega"],
-                        ) = hedge_view.add_and_show_greeks(
-                            self.current_price,
-                            implied_volatility,
-                            strike,
-                            days / 365,
-                            side,
-                        )
-                    elif "Delta" not in self.greeks["Option B"]:
-                        self.options["Option B"] = option
-                        (
-                            self.greeks["Option B"]["Delta"],
-                            self.greeks["Option B"]["Gamma"],
-                            self.greeks["Option B"]["Vega"],
-                        ) = hedge_view.add_and_show_greeks(
-                            self.current_price,
-                            implied_volatility,
-                            strike,
-                            days / 365,
-                            side,
-                        )
+                    if not self._g["set"][hedge_model.OPTION_A]:
+                        option_name = "Option A"
+                    elif not self._g["set"][hedge_model.OPTION_B]:
+                        option_name = "Option B"
                     else:
                         console.print(
                             "[red]The functionality only accepts two options. Therefore, please remove an "
                             "option with 'rmv' before continuing.[/red]\n"
                         )
+                        self._show_pending_positions()
                         return
 
-                    positions = pd.DataFrame()
-
-                    for _, values in self.options.items():
-                        # Loops over options in the dictionary. If a position is empty, skips the printing.
-                        if values:
-                            option_position: str = (
-                                "Long" if values["sign"] == 1 else "Short"
-                            )
-                            positions = positions.append(
-                                [
-                                    [
-                                        values["type"],
-                                        option_position,
-                                        values["strike"],
-                                        values["implied_volatility"],
-                                    ]
-                                ]
-                            )
-
-                    positions.columns = ["Type", "Hold", "Strike", "Implied Volatility"]
-
-                    print_rich_table(
-                        positions,
-                        title="Current Option Positions",
-                        headers=list(positions.columns),
-                        show_index=False,
+                    self.options[option_name] = option
+                    self._positions_cache = None
+                    self._positions_pending = True
+                    self.update_greeks(self._t_years)
+                    option_index = GREEKS_INDEX[option_name]
+                    hedge_view.show_greeks(
+                        self._g["delta"][option_index],
+                        self._g["gamma"][option_index],
+                        self._g["vega"][option_index],
+                        implied_volatility,
+                        strike,
                     )
 
+                    self._show_pending_positions()
+
                     if (
-                        "Delta" in self.greeks["Option A"]
-                        and "Delta" in self.greeks["Option B"]
+                        self._g["set"][hedge_model.OPTION_A]
+                        and self._g["set"][hedge_model.OPTION_B]
                     ):
                         hedge_view.show_calculated_hedge(
-                            self.amount, option["type"], self.greeks, sign
+                            self.amount, option["type"], self._g, sign
                         )
 
                     self.update_runtime_choices()
@@ -324,6 +464,9 @@ Underlying Asset Position: [/param]{self.underlying_asset_position}
         else:
             console.print("Please use a valid index\n")
 
+        # A failed add at the end of a batch still shows the positions added before it
+        self._show_pending_positions()
+
     @log_start_end(log=logger)
     def call_rmv(self, other_args: List[str]):
         """Process rmv command"""
@@ -356,42 +499,22 @@ Underlying Asset Position: [/param]{self.underlying_asset_position}
             else:
                 if ns_parser.all:
                     self.options = {"Option A": {}, "Option B": {}}
+                    self._g[[hedge_model.OPTION_A, hedge_model.OPTION_B]] = EMPTY_GREEKS
+                    self._positions_cache = None
                 else:
                     option_name = " ".join(ns_parser.option)
 
                     if option_name in self.options:
                         self.options[option_name] = {}
-                        self.greeks[option_name] = {}
+                        self._g[GREEKS_INDEX[option_name]] = EMPTY_GREEKS
+                        self._positions_cache = None
 
                         self.update_runtime_choices()
                     else:
                         console.print(f"{option_name} is not an option.")
 
                 if self.options["Option A"] or self.options["Option B"]:
-                    positions = pd.DataFrame()
-
-                    for _, value in self.options.items():
-                        if value:
-                            option_side: str = "Long" if value["sign"] == 1 else "Short"
-                            positions = positions.append(
-                                [
-                                    [
-                                        value["type"],
-                                        option_side,
-                                        value["strike"],
-                                        value["implied_volatility"],
-                                    ]
-                                ]
-                            )
-
-                    positions.columns = ["Type", "Hold", "Strike", "Implied Volatility"]
-
-                    print_rich_table(
-                        positions,
-                        title="Current Option Positions",
-                        headers=list(positions.columns),
-                        show_index=False,
-                    )
+                    self._render_positions()
 
                 console.print("")
         else:
@@ -432,6 +555,15 @@ Underlying Asset Position: [/param]{self.underlying_asset_position}
             strike_type, underlying_type, side_type = ns_parser.pick
             amount_type = ns_parser.amount
 
+            strikes = self._put_strikes if side_type == "Put" else self._call_strikes
+            index = _find_strike(strikes, float(strike_type))
+            if index == -1:
+                console.print(
+                    f"[red]{strike_type} is not an available {side_type} strike for "
+                    f"{self.expiration}. Use the 'list' command to see them.[/red]\n"
+                )
+                return
+
             self.underlying_asset_position = (
                 f"{underlying_type} {side_type} {amount_type} @ {strike_type}"
             )
@@ -451,36 +583,26 @@ Underlying Asset Position: [/param]{self.underlying_asset_position}
             self.amount = float(amount_type)
             self.strike = strike_type
 
-            index = -1
-            date_obj = datetime.strptime(self.expiration, "%Y-%m-%d")
-            days = float((date_obj - datetime.now()).days + 1)
-
-            if days == 0.0:
-                days = 0.01
-
             if side == -1:
-                for i in range(len(self.chain.puts["strike"])):
-                    if self.chain.puts["strike"][i] == self.strike:
-                        index = i
-                        break
-                implied_volatility = self.chain.puts["impliedVolatility"].iloc[index]
+                implied_volatility = self._put_iv_arr[index]
             else:
-                for i in range(len(self.chain.calls["strike"])):
-                    if self.chain.calls["strike"][i] == self.strike:
-                        index = i
-                        break
-                implied_volatility = self.chain.calls["impliedVolatility"].iloc[index]
-
-            (
-                self.greeks["Portfolio"]["Delta"],
-                self.greeks["Portfolio"]["Gamma"],
-                self.greeks["Portfolio"]["Vega"],
-            ) = add_hedge_option(
-                self.current_price,
-                implied_volatility,
-                float(self.strike),
-                days / 365,
-                side,
+                implied_volatility = self._call_iv_arr[index]
+
+            self.portfolio_option = {
+                "type": self.side,
+                "strike": float(self.strike),
+                "implied_volatility": implied_volatility,
+            }
+
+            self._g[hedge_model.PORTFOLIO] = (
+                *hedge_model.add_hedge_option(
+                    self.current_price,
+                    implied_volatility,
+                    float(self.strike),
+                    self._t_years,
+                    side,
+                ),
+                True,
             )
 
     @log_start_end(log=logger)
@@ -497,39 +619,16 @@ Underlying Asset Position: [/param]{self.underlying_asset_position}
             if not self.options["Option A"] and not self.options["Option B"]:
                 console.print("Please add Options by using the 'add' command.\n")
             else:
-                positions = pd.DataFrame()
-
-                for _, value in self.options.items():
-                    if value:
-                        option_side: str = "Long" if value["sign"] == 1 else "Short"
-                        positions = positions.append(
-                            [
-                                [
-                                    value["type"],
-                                    option_side,
-                                    value["strike"],
-                                    value["implied_volatility"],
-                                ]
-                            ]
-                        )
-
-                positions.columns = ["Type", "Hold", "Strike", "Implied Volatility"]
-
-                print_rich_table(
-                    positions,
-                    title="Current Option Positions",
-                    headers=list(positions.columns),
-                    show_index=False,
-                )
+                self._render_positions()
 
                 if (
-                    "Delta" in self.greeks["Option A"]
-                    and "Delta" in self.greeks["Option B"]
+                    self._g["set"][hedge_model.OPTION_A]
+                    and self._g["set"][hedge_model.OPTION_B]
                 ):
                     hedge_view.show_calculated_hedge(
                         self.amount,
                         self.options["Option A"]["type"],
-                        self.greeks,
+                        self._g,
                         self.options["Option A"]["sign"],
                     )
 
@@ -548,7 +647,7 @@ Underlying Asset Position: [/param]{self.underlying_asset_position}
         if ns_parser:
             plot_payoff(
                 self.current_price,
-                [self.options["Option A"], self.options["Option B"]],
+                self._selected_options(),
                 self.underlying,
                 self.ticker,
                 self.expiration,
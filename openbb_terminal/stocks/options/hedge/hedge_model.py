@@ -1,13 +1,17 @@
 """Hedge model"""
 __docformat__ = "numpy"
 
-import math
-
 import numpy as np
-from scipy.stats import norm
+from scipy.special import ndtr
 
 # Based on article of Roman Paolucci: https://towardsdatascience.com/algorithmic-portfolio-hedging-9e069aafff5a
 
+# Rows of the greeks array: the underlying asset position followed by option A and B
+PORTFOLIO, OPTION_A, OPTION_B = 0, 1, 2
+GREEKS_DTYPE = np.dtype(
+    [("delta", "f8"), ("gamma", "f8"), ("vega", "f8"), ("set", "?")]
+)
+
 
 def calc_hedge(portfolio_option_amount, side, greeks, sign):
     """Determine the hedge position and the weights within each option and
@@ -19,9 +23,9 @@ def calc_hedge(portfolio_option_amount, side, greeks, sign):
         Number to show
     side: str
         Whether you have a Call or Put instrument
-    greeks: dict
-        Dictionary containing delta, gamma and vega values for the portfolio and option A and B. Structure is
-        as follows: {'Portfolio': {'Delta': VALUE, 'Gamma': VALUE, 'Vega': VALUE}} etc
+    greeks: np.ndarray
+        Structured array of GREEKS_DTYPE containing delta, gamma and vega values for the portfolio and
+        option A and B, in that order. E.g. greeks["delta"][OPTION_A] is the delta of option A
     sign: int
         Whether you have a long (1) or short (-1) position
 
@@ -32,20 +36,10 @@ def calc_hedge(portfolio_option_amount, side, greeks, sign):
     portfolio weight: float
     is_singular: boolean
     """
-    # Shortnames for delta, gamma and vega of portfolio
-    portfolio_option_delta = greeks["Portfolio"]["Delta"]
-    portfolio_option_gamma = greeks["Portfolio"]["Gamma"]
-    portfolio_option_vega = greeks["Portfolio"]["Vega"]
-
-    # Shortnames for delta, gamma and vega of option A
-    option_a_delta = greeks["Option A"]["Delta"]
-    option_a_gamma = greeks["Option A"]["Gamma"]
-    option_a_vega = greeks["Option A"]["Vega"]
-
-    # Shortnames for delta, gamma and vega of option B
-    option_b_delta = greeks["Option B"]["Delta"]
-    option_b_gamma = greeks["Option B"]["Gamma"]
-    option_b_vega = greeks["Option B"]["Vega"]
+    # Shortnames for delta, gamma and vega of portfolio, option A and option B
+    portfolio_option_delta, option_a_delta, option_b_delta = greeks["delta"]
+    portfolio_option_gamma, option_a_gamma, option_b_gamma = greeks["gamma"]
+    portfolio_option_vega, option_a_vega, option_b_vega = greeks["vega"]
 
     # Delta will be positive for long call and short put positions, negative for short call and long put positions.
     delta_multiplier = 1
@@ -141,144 +135,48 @@ def add_hedge_option(price, implied_volatility, strike, days, side):
     gamma: float
     portfolio: float
     """
-    # Determine delta position given the option
-    delta = calc_delta(price, implied_volatility, strike, days, 0, side)
-
-    # Determine gamma position given the option
-    gamma = calc_gamma(price, implied_volatility, strike, days, 0)
-
-    # Determine vega position given the option
-    vega = calc_vega(price, implied_volatility, strike, days, 0)
+    # Determine delta, gamma and vega position given the option
+    delta, gamma, vega = greeks_batch(
+        np.array([price], dtype=np.float64),
+        np.array([implied_volatility], dtype=np.float64),
+        np.array([strike], dtype=np.float64),
+        np.array([days], dtype=np.float64),
+        np.array([side]),
+    )[0]
 
     return delta, gamma, vega
 
 
-def calc_delta(
-    asset_price,
-    asset_volatility,
-    strike_price,
-    time_to_expiration,
-    risk_free_rate,
-    side,
-):
-    """The first-order partial-derivative with respect to the underlying asset of the Black-Scholes
-    equation is known as delta. Delta refers to how the option value changes when there is a change in
-    the underlying asset price. Multiplying delta by a +-$1 change in the underlying asset, holding all other
-    parameters constant, will give you the new value of the option. Delta will be positive for long call and
-    short put positions, negative for short call and long put positions.
-
-    Parameters
-    ----------
-    asset_price: int
-        The price.
-    asset_volatility: float
-        The implied volatility.
-    strike_price: float
-        The strike price.
-    time_to_expiration: float
-        The amount of days until expiration. Use annual notation thus a month would be 30 / 360.
-    risk_free_rate: float
-        The risk free rate.
-    sign: int
-        Whether you have a long (1) or short (-1) position
-
-    Returns
-    -------
-    delta: float
-        Returns the value for the delta.
-    """
-    b = math.exp(-risk_free_rate * time_to_expiration)
-    x1 = (
-        math.log(asset_price / (b * strike_price))
-        + 0.5 * (asset_volatility * asset_volatility) * time_to_expiration
-    )
-    x1 = x1 / (asset_volatility * (time_to_expiration**0.5))
-    delta = norm.cdf(x1)
-
-    if side == 1:
-        return delta
-
-    return delta - 1
-
-
-def calc_gamma(
-    asset_price, asset_volatility, strike_price, time_to_expiration, risk_free_rate
-):
-    """The second-order partial-derivative with respect to the underlying asset of the Black-Scholes equation
-    is known as gamma. Gamma refers to how the option’s delta changes when there is a change in the underlying
-    asset price. Multiplying gamma by a +-$1 change in the underlying asset, holding all other parameters constant,
-    will give you the new value of the option’s delta. Essentially, gamma is telling us the rate of change of delta
-    given a +-1 change in the underlying asset price. Gamma is always positive for long positions and
-    negative for short positions.
+def greeks_batch(prices, implied_volatilities, strikes, times, sides):
+    """Determine the delta, gamma and vega values of several options at once.
 
     Parameters
     ----------
-    asset_price: int
-        The price.
-    asset_volatility: float
-        The implied volatility.
-    strike_price: float
-        The strike price.
-    time_to_expiration: float
+    prices: np.ndarray
+        The prices.
+    implied_volatilities: np.ndarray
+        The implied volatilities.
+    strikes: np.ndarray
+        The strike prices.
+    times: np.ndarray
         The amount of days until expiration. Use annual notation thus a month would be 30 / 360.
-    risk_free_rate: float
-        The risk free rate.
-    sign: int
-        Whether you have a long (1) or short (-1) position
+    sides: np.ndarray
+        Whether each option is a call (1) or put (-1)
 
     Returns
     -------
-    gamma: float
-        Returns the value for the gamma.
+    greeks: np.ndarray
+        Array of shape (n, 3) with the delta, gamma and vega of each option.
     """
-    b = math.exp(-risk_free_rate * time_to_expiration)
+    sqrt_t = np.sqrt(times)
     x1 = (
-        math.log(asset_price / (b * strike_price))
-        + 0.5 * (asset_volatility * asset_volatility) * time_to_expiration
-    )
-    x1 = x1 / (asset_volatility * (time_to_expiration**0.5))
-    z1 = norm.cdf(x1)
-    gamma = z1 / (asset_price * asset_volatility * math.sqrt(time_to_expiration))
-
-    return gamma
-
+        np.log(prices / strikes)
+        + 0.5 * (implied_volatilities * implied_volatilities) * times
+    ) / (implied_volatilities * sqrt_t)
+    z1 = ndtr(x1)
 
-def calc_vega(
-    asset_price, asset_volatility, strike_price, time_to_expiration, risk_free_rate
-):
-    """The first-order partial-derivative with respect to the underlying asset volatility of
-    the Black-Scholes equation is known as vega. Vega refers to how the option value
-    changes when there is a change in the underlying asset volatility. Multiplying vega by
-    a +-1% change in the underlying asset volatility, holding all other parameters constant, will give
-    you the new value of the option. Vega will be positive for long positions and negative for short positions.
-
-    Parameters
-    ----------
-    asset_price: int
-        The price.
-    asset_volatility: float
-        The implied volatility.
-    strike_price: float
-        The strike price.
-    time_to_expiration: float
-        The amount of days until expiration. Use annual notation thus a month would be 30 / 360.
-    risk_free_rate: float
-        The risk free rate.
-    sign: int
-        Whether you have a long (1) or short (-1) position
-
-    Returns
-    -------
-    vega: float
-        Returns the value for the gamma.
-    """
-    b = math.exp(-risk_free_rate * time_to_expiration)
-    x1 = (
-        math.log(asset_price / (b * strike_price))
-        + 0.5 * (asset_volatility * asset_volatility) * time_to_expiration
-    )
-    x1 = x1 / (asset_volatility * (time_to_expiration**0.5))
-    z1 = norm.cdf(x1)
-    vega = asset_price * z1 * math.sqrt(time_to_expiration)
+    delta = np.where(sides == 1, z1, z1 - 1)
+    gamma = z1 / (prices * implied_volatilities * sqrt_t)
+    vega = prices * z1 * sqrt_t / 100
 
-    return vega / 100
+    return np.column_stack((delta, gamma, vega))
@@ -14,33 +14,22 @@ from openbb_terminal.stocks.options.hedge import hedge_model
 logger = logging.getLogger(__name__)
 
 
-def add_and_show_greeks(price, implied_volatility, strike, days, side):
-    """Determine the delta, gamma and vega value of the portfolio and/or options and show them.
+def show_greeks(delta, gamma, vega, implied_volatility, strike):
+    """Show the delta, gamma and vega value of an option.
 
     Parameters
     ----------
-    price: int
-        The price.
+    delta: float
+        The delta.
+    gamma: float
+        The gamma.
+    vega: float
+        The vega.
     implied_volatility: float
         The implied volatility.
     strike: float
         The strike price.
-    days: float
-        The amount of days until expiration. Use annual notation thus a month would be 30 / 360.
-    sign: int
-        Whether you have a long (1) or short (-1) position
-
-    Returns
-    -------
-    delta: float
-    gamma: float
-    vega: float
     """
-    # Add in hedge option
-    delta, gamma, vega = hedge_model.add_hedge_option(
-        price, implied_volatility, strike, days, side
-    )
-
     # Show the added delta, gamma and vega positions. Next to that, also show the inputted
     # implied volatility and strike
     positions = pd.DataFrame(
@@ -54,8 +43,6 @@ def add_and_show_greeks(price, implied_volatility, strike, days, side):
 
     console.print()
 
-    return delta, gamma, vega
-
 
 def show_calculated_hedge(portfolio_option_amount, side, greeks, sign):
     """Determine the hedge position and the weights within each option and
@@ -67,9 +54,9 @@ def show_calculated_hedge(portfolio_option_amount, side, greeks, sign):
         Number to show
     side: str
         Whether you have a Call or Put instrument
-    greeks: dict
-        Dictionary containing delta, gamma and vega values for the portfolio and option A and B. Structure is
-        as follows: {'Portfolio': {'Delta': VALUE, 'Gamma': VALUE, 'Vega': VALUE}} etc
+    greeks: np.ndarray
+        Structured array of hedge_model.GREEKS_DTYPE containing delta, gamma and vega values for the
+        portfolio and option A and B, in that order
     sign: int
         Whether you have a long (1) or short (-1) position
 
@@ -0,0 +1,263 @@
+# IMPORTATION STANDARD
+import weakref
+from types import SimpleNamespace
+
+# IMPORTATION THIRDPARTY
+import numpy as np
+import pandas as pd
+import pytest
+
+# IMPORTATION INTERNAL
+from openbb_terminal.stocks.options.hedge import hedge_controller
+
+# pylint: disable=W0212
+
+
+def cached_double(mocker, maxsize, ttl):
+    calls = []
+
+    @hedge_controller._ttl_cache(maxsize=maxsize, ttl=ttl)
+    def double(value):
+        calls.append(value)
+        return 2 * value
+
+    clock = mocker.patch.object(hedge_controller.time, "monotonic", return_value=0.0)
+
+    return double, calls, clock
+
+
+def test_ttl_cache_expiry(mocker):
+    double, calls, clock = cached_double(mocker, maxsize=2, ttl=10)
+
+    assert double(1) == 2
+    clock.return_value = 9.9
+    assert double(1) == 2
+    assert calls == [1]
+
+    clock.return_value = 10.0
+    assert double(1) == 2
+    assert calls == [1, 1]
+
+    # The refreshed entry lives for another ttl seconds
+    clock.return_value = 19.9
+    assert double(1) == 2
+    assert calls == [1, 1]
+
+
+def test_ttl_cache_eviction(mocker):
+    double, calls, _ = cached_double(mocker, maxsize=2, ttl=10)
+
+    assert double(1) == 2
+    assert double(2) == 4
+    assert double(3) == 6
+    assert calls == [1, 2, 3]
+
+    # 1 was the oldest entry and got evicted, 2 and 3 are still cached
+    assert double(2) == 4
+    assert double(3) == 6
+    assert double(1) == 2
+    assert calls == [1, 2, 3, 1]
+
+
+def test_ttl_cache_purges_expired(mocker):
+    class Chain:
+        pass
+
+    @hedge_controller._ttl_cache(maxsize=4, ttl=10)
+    def get_chain(_ticker):
+        return Chain()
+
+    clock = mocker.patch.object(hedge_controller.time, "monotonic", return_value=0.0)
+
+    chain_ref = weakref.ref(get_chain("AAPL"))
+    assert chain_ref() is not None
+
+    # Requesting another key drops the expired entry instead of keeping it around
+    clock.return_value = 10.0
+    get_chain("MSFT")
+    assert chain_ref() is None
+
+
+STRIKES = np.array([10.0, 12.37, 15.0, 17.5, 102.05], dtype=np.float64).astype(
+    np.float32
+)
+
+
+@pytest.mark.parametrize(
+    "strike, index",
+    [
+        (10.0, 0),
+        (12.37, 1),
+        (17.5, 3),
+        (102.05, 4),
+        (12.5, -1),
+        (12.36, -1),
+        (5.0, -1),
+        (105.0, -1),
+    ],
+)
+def test_find_strike(strike, index):
+    assert hedge_controller._find_strike(STRIKES, strike) == index
+
+
+def test_build_menu_choices():
+    pick_choices, add_choices = hedge_controller._build_menu_choices(
+        (67.5, 70.0, 12.37), (65.0, 67.5), 3
+    )
+
+    assert pick_choices == (
+        "67.5 Long Call",
+        "67.5 Short Call",
+        "70 Long Call",
+        "70 Short Call",
+        "12.37 Long Call",
+        "12.37 Short Call",
+        "65 Long Put",
+        "65 Short Put",
+        "67.5 Long Put",
+        "67.5 Short Put",
+    )
+    assert add_choices == ("0", "1", "2")
+
+
+PATH_CONTROLLER = "openbb_terminal.stocks.options.hedge.hedge_controller"
+
+CHAIN = SimpleNamespace(
+    calls=pd.DataFrame(
+        {
+            "strike": [95.0, 100.0, 105.0],
+            "impliedVolatility": [0.3, 0.25, 0.2],
+            "lastPrice": [7.5, 4.0, 1.5],
+        }
+    ),
+    puts=pd.DataFrame(
+        {
+            "strike": [95.0, 100.0, 110.0],
+            "impliedVolatility": [0.35, 0.3, 0.25],
+            "lastPrice": [1.0, 3.5, 10.5],
+        }
+    ),
+)
+
+
+def make_controller(mocker, queue=None):
+    mocker.patch(target=f"{PATH_CONTROLLER}._cached_chain", return_value=CHAIN)
+    mocker.patch(target=f"{PATH_CONTROLLER}._cached_price", return_value=100.0)
+
+    return hedge_controller.HedgeController(
+        ticker="MOCK_TICKER",
+        expiration="2099-01-16",
+        queue=queue,
+    )
+
+
+@pytest.mark.vcr(record_mode="none")
+def test_call_add_renders_positions_after_batch(mocker):
+    controller = make_controller(mocker, queue=["add 1"])
+    render = mocker.patch.object(controller, "_render_positions")
+    controller.call_pick(["100", "Long", "Call"])
+
+    # Another add is queued next, so the table waits for it
+    controller.call_add(["0"])
+    render.assert_not_called()
+
+    controller.queue = []
+    controller.call_add(["1"])
+    render.assert_called_once()
+
+
+@pytest.mark.vcr(record_mode="none")
+@pytest.mark.parametrize(
+    "failing_args",
+    [
+        ["2"],
+        ["-p"],
+    ],
+)
+def test_call_add_failed_last_add_renders_positions(failing_args, mocker):
+    controller = make_controller(mocker, queue=["add 1", "add 2"])
+    render = mocker.patch.object(controller, "_render_positions")
+    controller.call_pick(["100", "Long", "Call"])
+
+    controller.call_add(["0"])
+    controller.queue.pop(0)
+    controller.call_add(["1"])
+    controller.queue.pop(0)
+    render.assert_not_called()
+
+    # A third option is refused and a missing identifier fails to parse
+    controller.call_add(failing_args)
+    render.assert_called_once()
+
+
+@pytest.mark.vcr(record_mode="none")
+def test_call_rmv_all_allows_new_add(mocker):
+    controller = make_controller(mocker)
+    mocker.patch.object(controller, "_render_positions")
+    controller.call_pick(["100", "Long", "Call"])
+    controller.call_add(["0"])
+    controller.call_add(["1"])
+
+    controller.call_rmv(["-a"])
+
+    assert not controller._g["set"][hedge_controller.hedge_model.OPTION_A]
+    assert not controller._g["set"][hedge_controller.hedge_model.OPTION_B]
+    assert controller._g["set"][hedge_controller.hedge_model.PORTFOLIO]
+
+    controller.call_add(["2"])
+
+    assert controller.options["Option A"]["strike"] == 105.0
+    assert controller._g["set"][hedge_controller.hedge_model.OPTION_A]
+    assert not controller._g["set"][hedge_controller.hedge_model.OPTION_B]
+
+
+@pytest.mark.vcr(record_mode="none")
+def test_call_sop(mocker):
+    controller = make_controller(mocker)
+    render = mocker.patch.object(controller, "_render_positions")
+    mock_hedge = mocker.patch(
+        target=f"{PATH_CONTROLLER}.hedge_view.show_calculated_hedge"
+    )
+    controller.call_pick(["100", "Long", "Call"])
+    controller.call_add(["0"])
+    controller.call_add(["-p", "-i", "2"])
+    render.reset_mock()
+    mock_hedge.reset_mock()
+
+    controller.call_sop([])
+
+    render.assert_called_once()
+    mock_hedge.assert_called_once_with(1000.0, "Call", controller._g, 1)
+
+
+@pytest.mark.vcr(record_mode="none")
+@pytest.mark.parametrize(
+    "pick",
+    [
+        ["103", "Short", "Put"],
+        ["110", "Long", "Call"],
+    ],
+)
+def test_call_pick_unlisted_strike(pick, mocker):
+    controller = make_controller(mocker)
+    controller.call_pick(["100", "Long", "Call"])
+    position = controller.underlying_asset_position
+    portfolio_greeks = controller._g[hedge_controller.hedge_model.PORTFOLIO].copy()
+
+    controller.call_pick(pick)
+
+    assert controller.underlying_asset_position == position
+    assert controller.underlying == 1
+    assert controller.side == "Call"
+    assert controller._g[hedge_controller.hedge_model.PORTFOLIO] == portfolio_greeks
+
+
+@pytest.mark.vcr(record_mode="none")
+def test_call_pick_put_only_strike(mocker):
+    controller = make_controller(mocker)
+
+    controller.call_pick(["110", "Long", "Put"])
+
+    assert controller.underlying_asset_position == "Long Put 1000 @ 110"
+    assert controller.portfolio_option["implied_volatility"] == 0.25
+    assert controller._g["set"][hedge_controller.hedge_model.PORTFOLIO]
@@ -0,0 +1,104 @@
+# IMPORTATION STANDARD
+import math
+
+# IMPORTATION THIRDPARTY
+import numpy as np
+import pytest
+
+# IMPORTATION INTERNAL
+from openbb_terminal.stocks.options.hedge import hedge_model
+
+
+def scalar_greeks(price, implied_volatility, strike, time, side):
+    x1 = (
+        math.log(price / strike) + 0.5 * implied_volatility * implied_volatility * time
+    ) / (implied_volatility * math.sqrt(time))
+    z1 = 0.5 * (1 + math.erf(x1 / math.sqrt(2)))
+
+    delta = z1 if side == 1 else z1 - 1
+    gamma = z1 / (price * implied_volatility * math.sqrt(time))
+    vega = price * z1 * math.sqrt(time) / 100
+
+    return delta, gamma, vega
+
+
+OPTIONS = [
+    (100.0, 0.3, 105.0, 30 / 365, 1),
+    (100.0, 0.3, 105.0, 30 / 365, -1),
+    (250.0, 0.55, 200.0, 0.01 / 365, 1),
+    (42.5, 0.12, 45.0, 1.5, -1),
+]
+
+
+def test_greeks_batch():
+    prices, ivs, strikes, times, sides = (np.array(column) for column in zip(*OPTIONS))
+
+    result = hedge_model.greeks_batch(prices, ivs, strikes, times, sides)
+
+    assert result.shape == (len(OPTIONS), 3)
+    np.testing.assert_allclose(
+        result, [scalar_greeks(*option) for option in OPTIONS], rtol=1e-12
+    )
+
+
+def test_greeks_batch_values():
+    result = hedge_model.greeks_batch(
+        np.array([100.0]),
+        np.array([0.3]),
+        np.array([105.0]),
+        np.array([30 / 365]),
+        np.array([1]),
+    )
+
+    np.testing.assert_allclose(
+        result[0],
+        [0.3000434684786365, 0.03488580327110264, 0.08601978888765036],
+        rtol=1e-12,
+    )
+
+
+@pytest.mark.parametrize("option", OPTIONS)
+def test_add_hedge_option(option):
+    result = hedge_model.add_hedge_option(*option)
+
+    np.testing.assert_allclose(result, scalar_greeks(*option), rtol=1e-12)
+
+
+def make_greeks(delta, gamma, vega):
+    greeks = np.zeros(3, dtype=hedge_model.GREEKS_DTYPE)
+    greeks["delta"] = delta
+    greeks["gamma"] = gamma
+    greeks["vega"] = vega
+    greeks["set"] = True
+
+    return greeks
+
+
+def test_calc_hedge():
+    # Portfolio, option A and option B
+    greeks = make_greeks(
+        delta=[0.4, 0.5, 0.25],
+        gamma=[0.5, 1.0, 0.0],
+        vega=[1.0, 0.0, 2.0],
+    )
+
+    weight_a, weight_b, weight_shares, is_singular = hedge_model.calc_hedge(
+        10, "Call", greeks, 1
+    )
+
+    assert weight_a == pytest.approx(5.0)
+    assert weight_b == pytest.approx(5.0)
+    assert weight_shares == pytest.approx(0.0)
+    assert not is_singular
+
+
+def test_calc_hedge_singular():
+    greeks = make_greeks(
+        delta=[0.4, 0.5, 0.5],
+        gamma=[0.5, 1.0, 1.0],
+        vega=[1.0, 2.0, 2.0],
+    )
+
+    *_, is_singular = hedge_model.calc_hedge(10, "Put", greeks, -1)
+
+    assert is_singular